@@ -24,6 +24,9 @@ following response:
 In such cases, the filterable field should be added to INDEX_FILTERABLES below. And you should
 then run the `create_indexes()` function again, as indicated above.
 
+Likewise, the fields that search results can be sorted by are listed in INDEX_SORTABLES, and
+`create_indexes()` must be run again after changing them.
+
 This search engine was tested for the following indexes:
 
 1. course_info ("course discovery"):
@@ -58,9 +61,10 @@ can troubleshoot these tasks by printing them with:
     ./manage.py lms shell -c "import search.meilisearch; search.meilisearch.print_failed_meilisearch_tasks()"
 """
 
-from copy import deepcopy
 from datetime import datetime
+import functools
 import hashlib
+import itertools
 import json
 import logging
 import typing as t
@@ -78,6 +82,8 @@ from search.utils import ValueRange
 MEILISEARCH_API_KEY = getattr(settings, "MEILISEARCH_API_KEY", "")
 MEILISEARCH_URL = getattr(settings, "MEILISEARCH_URL", "http://meilisearch")
 MEILISEARCH_INDEX_PREFIX = getattr(settings, "MEILISEARCH_INDEX_PREFIX", "")
+# Number of documents sent to Meilisearch in a single indexing request
+MEILISEARCH_BATCH_SIZE = getattr(settings, "MEILISEARCH_BATCH_SIZE", 5000)
 
 
 logger = logging.getLogger(__name__)
@@ -85,6 +91,11 @@ logger = logging.getLogger(__name__)
 
 PRIMARY_KEY_FIELD_NAME = "_pk"
 UTC_OFFSET_SUFFIX = "__utcoffset"
+INDEX_NOT_FOUND_ERROR_CODE = "index_not_found"
+
+# Values of these exact types are indexed as-is: checking for them first saves the
+# isinstance calls for the vast majority of document fields.
+_PLAIN_VALUE_TYPES = frozenset([str, int, float, bool, list, type(None)])
 
 
 # In Meilisearch, we need to explicitly list fields for which we expect to define
@@ -126,21 +137,16 @@ class MeilisearchEngine(SearchEngine):
     compliant with edx-search's ElasticSearchEngine.
     """
 
-    def __init__(self, index=None) -> None:
-        super().__init__(index=index)
-        self._meilisearch_index: t.Optional[meilisearch.index.Index] = None
-
-    @property
+    @functools.cached_property
     def meilisearch_index(self) -> meilisearch.index.Index:
         """
         Lazy load meilisearch index.
+
+        Its sortable attributes are set by `create_indexes`, along with the filterable ones.
         """
-        if self._meilisearch_index is None:
-            meilisearch_index_name = get_meilisearch_index_name(self.index_name)
-            meilisearch_client = get_meilisearch_client()
-            self._meilisearch_index = meilisearch_client.index(meilisearch_index_name)
-            self._meilisearch_index.update_sortable_attributes(INDEX_SORTABLES.get(self.index_name, []))
-        return self._meilisearch_index
+        meilisearch_index_name = get_meilisearch_index_name(self.index_name)
+        meilisearch_client = get_meilisearch_client()
+        return meilisearch_client.index(meilisearch_index_name)
 
     @property
     def meilisearch_index_name(self):
@@ -152,6 +158,9 @@ class MeilisearchEngine(SearchEngine):
     def index(self, sources: list[dict[str, t.Any]], **kwargs):
         """
         Index a number of documents, which can have just any type.
+
+        Documents are sent in batches of MEILISEARCH_BATCH_SIZE, which keeps both the request
+        size and the memory used for processing and encoding bounded.
         """
         logger.info(
             "Index request: index=%s sources=%s kwargs=%s",
@@ -159,10 +168,19 @@ class MeilisearchEngine(SearchEngine):
             sources,
             kwargs,
         )
-        processed_documents = [process_document(source) for source in sources]
-        self.meilisearch_index.add_documents(
-            processed_documents, serializer=DocumentEncoder
-        )
+        sources = iter(sources)
+        while batch := list(itertools.islice(sources, MEILISEARCH_BATCH_SIZE)):
+            processed_documents = [process_document(source) for source in batch]
+            self.meilisearch_index.add_documents_json(self._serialize_for_transport(processed_documents))
+
+    def _serialize_for_transport(self, documents: list[dict[str, t.Any]]) -> bytes:
+        """
+        Encode a batch of processed documents into the request body sent to Meilisearch.
+
+        Override this to change the encoder. Note that Meilisearch only accepts JSON (as well
+        as NDJSON and CSV) document payloads, so the result must be a JSON array.
+        """
+        return encode_documents(documents)
 
     def search(
         self,
@@ -208,27 +226,37 @@ class MeilisearchEngine(SearchEngine):
     ) -> dict:
         """
         For each selected facet, get all its available options within the selected filters.
-        """
-        for facet in field_dictionary.keys():
-            expanded_facet_distribution = self._get_expanded_distribution(
-                query_string,
-                facet,
-                opt_params.get("filter", []),
-            )
-            meilisearch_results.setdefault("facetDistribution", {})[facet] = expanded_facet_distribution
 
-    def _get_expanded_distribution(self, query: str, facet_to_exclude: str, filter_rules: list) -> dict:
+        The secondary queries are sent together in a single multi-search request, such that
+        expanding many facets costs a single round trip to Meilisearch.
         """
-        Run a secondary query excluding one facet to get its full distribution.
-        Only return distribution data, without any actual results.
+        facets = list(field_dictionary.keys())
+        if not facets:
+            return
+        filter_rules = opt_params.get("filter", [])
+        queries = [
+            {
+                "indexUid": self.meilisearch_index_name,
+                "q": query_string,
+                **self._get_expanded_distribution_params(facet, filter_rules),
+            }
+            for facet in facets
+        ]
+        responses = get_meilisearch_client().multi_search(queries)["results"]
+        facet_distribution = meilisearch_results.setdefault("facetDistribution", {})
+        for facet, response in zip(facets, responses):
+            facet_distribution[facet] = response.get("facetDistribution", {}).get(facet, {})
+
+    @staticmethod
+    def _get_expanded_distribution_params(facet_to_exclude: str, filter_rules: list) -> dict:
         """
-        secondary_opt_params = {
+        Search parameters for the distribution of one facet, ignoring the rules on that facet.
+        """
+        return {
             'facets': [facet_to_exclude],
             'filter': [rule for rule in filter_rules if not rule.startswith(f"{facet_to_exclude} = ")],
             'limit': 0,
         }
-        result = self.meilisearch_index.search(query, secondary_opt_params)
-        return result.get("facetDistribution", {}).get(facet_to_exclude, {})
 
     def remove(self, doc_ids, **kwargs):
         """
@@ -265,6 +293,13 @@ class DocumentEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def encode_documents(documents: list[dict[str, t.Any]]) -> bytes:
+    """
+    Serialize documents to a JSON payload for `add_documents_json`.
+    """
+    return json.dumps(documents, cls=DocumentEncoder).encode()
+
+
 def print_failed_meilisearch_tasks(count: int = 10):
     """
     Useful function for troubleshooting.
@@ -295,6 +330,7 @@ def create_indexes(index_filterables: t.Optional[dict[str, list[str]]] = None):
         meilisearch_index_name = get_meilisearch_index_name(index_name)
         index = get_or_create_meilisearch_index(client, meilisearch_index_name)
         update_index_filterables(client, index, filterables)
+        update_index_sortables(client, index, INDEX_SORTABLES.get(index_name, []))
 
 
 def get_or_create_meilisearch_index(
@@ -309,7 +345,7 @@ def get_or_create_meilisearch_index(
     try:
         return client.get_index(index_name)
     except meilisearch.errors.MeilisearchApiError as e:
-        if e.code != "index_not_found":
+        if e.code != INDEX_NOT_FOUND_ERROR_CODE:
             raise
         task_info = client.create_index(
             index_name, {"primaryKey": PRIMARY_KEY_FIELD_NAME}
@@ -338,6 +374,25 @@ def update_index_filterables(
     wait_for_task_to_succeed(client, task_info)
 
 
+def update_index_sortables(
+    client: meilisearch.Client, index: meilisearch.index.Index, sortables: list[str]
+) -> None:
+    """
+    Make sure that the sortable fields of an index include the given list of fields.
+
+    If existing fields are present, they are preserved.
+    """
+    if not sortables:
+        return
+    existing_sortables = set(index.get_sortable_attributes())
+    if set(sortables).issubset(existing_sortables):
+        # all sortable fields are already present
+        return
+    all_sortables = list(existing_sortables.union(sortables))
+    task_info = index.update_sortable_attributes(all_sortables)
+    wait_for_task_to_succeed(client, task_info)
+
+
 def wait_for_task_to_succeed(
     client: meilisearch.Client,
     task_info: meilisearch.task.TaskInfo,
@@ -391,7 +446,9 @@ def process_nested_document(doc: dict[str, t.Any]) -> dict[str, t.Any]:
     """
     processed = {}
     for key, value in doc.items():
-        if isinstance(value, timezone.datetime):
+        if type(value) in _PLAIN_VALUE_TYPES:
+            processed[key] = value
+        elif isinstance(value, timezone.datetime):
             # Convert datetime objects to timestamp, and store the timezone in a
             # separate field with a suffix given by UTC_OFFSET_SUFFIX.
             utcoffset = None
@@ -408,6 +465,7 @@ def process_nested_document(doc: dict[str, t.Any]) -> dict[str, t.Any]:
     return processed
 
 
+@functools.lru_cache(maxsize=16384)
 def id2pk(value: str) -> str:
     """
     Convert a document "id" field into a primary key that is compatible with Meilisearch.
@@ -415,6 +473,9 @@ def id2pk(value: str) -> str:
     This step is necessary because the "id" is typically a course id, which includes
     colon ":" characters, which are not supported by Meilisearch. Source:
     https://www.meilisearch.com/docs/learn/getting_started/primary_key#formatting-the-document-id
+
+    The same ids show up again and again, in both indexing and exclusion filters, so the
+    results are cached.
     """
     return hashlib.sha1(value.encode()).hexdigest()
 
@@ -585,13 +646,13 @@ def process_results(results: dict[str, t.Any], index_name: str) -> dict[str, t.A
                 'aggs': {
                     'modes': {
                         'terms': {'audit': 1},
-                        'total': 1.0,
+                        'total': 1,
                         'other': 0
                     },
                     'org': {
-                        'terms': {'OpenedX': 1}, 'total': 1.0, 'other': 0
+                        'terms': {'OpenedX': 1}, 'total': 1, 'other': 0
                     },
-                    'language': {'terms': {'en': 1}, 'total': 1.0, 'other': 0}
+                    'language': {'terms': {'en': 1}, 'total': 1, 'other': 0}
                 }
             }
     """
@@ -600,7 +661,15 @@ def process_results(results: dict[str, t.Any], index_name: str) -> dict[str, t.A
         "took": results["processingTimeMs"],
         "total": results["estimatedTotalHits"],
         "results": [],
-        "aggs": {},
+        # Aggregates/Facets
+        "aggs": {
+            facet_name: {
+                "terms": facet_distribution,
+                "total": sum(facet_distribution.values()),
+                "other": 0,
+            }
+            for facet_name, facet_distribution in results.get("facetDistribution", {}).items()
+        },
     }
 
     # Hits
@@ -617,29 +686,19 @@ def process_results(results: dict[str, t.Any], index_name: str) -> dict[str, t.A
         }
         processed["results"].append(processed_result)
     processed["max_score"] = max_score
-
-    # Aggregates/Facets
-    for facet_name, facet_distribution in results.get("facetDistribution", {}).items():
-        total = sum(facet_distribution.values())
-        processed["aggs"][facet_name] = {
-            "terms": facet_distribution,
-            "total": total,
-            "other": 0,
-        }
     return processed
 
 
 def process_hit(hit: dict[str, t.Any]) -> dict[str, t.Any]:
     """
     Convert a search result back to the ES format.
+
+    Only top-level fields are modified, so a shallow copy is enough to leave the hit untouched.
     """
-    processed = deepcopy(hit)
+    processed = dict(hit)
 
     # Remove primary key field
-    try:
-        processed.pop(PRIMARY_KEY_FIELD_NAME)
-    except KeyError:
-        pass
+    processed.pop(PRIMARY_KEY_FIELD_NAME, None)
 
     # Convert datetime fields back to datetime
     for key in list(processed.keys()):
@@ -0,0 +1,110 @@
+""" Setup and tests shared by the multi-value and single-value search API test cases """
+import functools
+import logging
+import uuid
+
+from django.conf import settings
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from search.search_engine_base import SearchEngine
+from search.tests.utils import setup_meilisearch, setup_elasticsearch, setup_democourse
+
+
+logger = logging.getLogger(__name__)
+
+# Set up an index for the given engine and index name, and return its engine config
+ENGINE_SETUPS = {
+    "meilisearch": functools.partial(setup_meilisearch, logger=logger),
+    "elasticsearch": setup_elasticsearch,
+}
+
+
+class CourseListSearchMixin:
+    """
+    Search API tests shared by the multi-value and single-value endpoints, for every engine.
+
+    Subclasses set url_name to the endpoint under test and engine to one of the ENGINE_SETUPS
+    keys. Each test case gets an index of its own, and the demo courses are indexed once per
+    test case, so tests must not modify the index.
+    """
+    url_name = None
+    engine = None
+
+    @classmethod
+    def setUpClass(cls):
+        index_name = f"test_index_{cls.__name__.lower()}_{uuid.uuid4().hex}"
+        cls.engine_config = ENGINE_SETUPS[cls.engine](index_name)
+        # Entered before the setup of the parent classes, which runs setUpTestData
+        cls.enterClassContext(override_settings(
+            SEARCH_ENGINE=cls.engine_config["search_engine"],
+            COURSEWARE_CONTENT_INDEX_NAME=index_name,
+            COURSEWARE_INFO_INDEX_NAME=index_name,
+        ))
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Index the demo courses once for the whole test case"""
+        super().setUpTestData()
+        # Not kept as a class attribute: Django deep-copies those for every test
+        searcher = SearchEngine.get_search_engine(settings.COURSEWARE_INFO_INDEX_NAME)
+        setup_democourse(searcher)
+        cls.engine_config["wait"]()
+
+    @classmethod
+    @functools.cache
+    def url(cls):
+        """URL of the endpoint under test, resolved on first use rather than at import"""
+        return reverse(cls.url_name)
+
+    def _post(self, params):
+        """
+        Helper method to send a post request through the test case's client.
+
+        The in-process test client is not thread-safe, so tests post their requests one at a time.
+        """
+        response = self.client.post(self.url(), params)
+        return response.status_code, response.json()
+
+    def test_search_string(self):
+        """Tests that keyword search returns correct number of matching documents."""
+        code, results = self._post({})
+        self.assertEqual(code, 200)
+        self.assertEqual(results["total"], 3)
+
+        code, results = self._post({"search_string": "right"})
+        self.assertEqual(code, 200)
+        self.assertEqual(results["total"], 1)
+
+        code, results = self._post({"search_string": "parameter"})
+        self.assertEqual(code, 200)
+        self.assertEqual(results["total"], 2)
+
+    def test_org_filter(self):
+        """Tests filtering results by the 'org' facet."""
+        code, results = self._post({"org": "OrgA"})
+        self.assertEqual(code, 200)
+        self.assertEqual(results["total"], 1)
+        self.assertEqual(results["results"][0]["data"]["org"], "OrgA")
+
+        code, results = self._post({"org": "OrgB"})
+        self.assertEqual(code, 200)
+        self.assertEqual(results["total"], 1)
+        self.assertEqual(results["results"][0]["data"]["org"], "OrgB")
+
+    def test_search_with_pagination(self):
+        """Tests that pagination limits and offsets results correctly."""
+        code, results = self._post({"page_size": 2})
+        self.assertEqual(code, 200)
+        self.assertEqual(len(results["results"]), 2)
+
+        code, results = self._post({"page_size": 2, "page_index": 1})
+        self.assertEqual(code, 200)
+        self.assertEqual(len(results["results"]), 1)
+
+    def test_bad_search_string(self):
+        """Tests that non-matching search terms return no results."""
+        code, results = self._post({"search_string": "doesnotexist123"})
+        self.assertEqual(code, 200)
+        self.assertEqual(results["total"], 0)
@@ -1,11 +1,26 @@
 """ Classes to populate test data """
-import copy
 from datetime import datetime
 
 
+def _clone_course(course, nested_fields=("content",)):
+    """
+    Copy a course dictionary, going one level deeper for the nested_fields.
+
+    All other values are immutable, so they can be shared with the original; add any new
+    nested field of DemoCourse.DEMO_COURSE to nested_fields.
+    """
+    course_copy = course.copy()
+    for field in nested_fields:
+        if field in course_copy:
+            course_copy[field] = course_copy[field].copy()
+    return course_copy
+
+
 class DemoCourse:
     """ Class for dispensing demo courses """
     DEMO_COURSE_ID = "edX/DemoX/Demo_Course"
+    # Dates stay as datetime objects rather than pre-serialized ISO strings: the Meilisearch
+    # engine only converts datetime values to the numeric timestamps used by range filters.
     DEMO_COURSE = {
         "start": datetime(2014, 2, 1),
         "number": "DemoX",
@@ -28,12 +43,11 @@ class DemoCourse:
     def get(cls, update_dict=None, remove_fields=None):
         """ get a new demo course """
         cls.demo_course_count += 1
-        course_copy = copy.deepcopy(cls.DEMO_COURSE)
-        if update_dict:
-            if "content" in update_dict:
-                course_copy["content"].update(update_dict["content"])
-                del update_dict["content"]
-            course_copy.update(update_dict)
+        update_dict = update_dict or {}
+        # update_dict is left untouched, so callers may reuse it
+        course_copy = _clone_course(cls.DEMO_COURSE)
+        course_copy["content"].update(update_dict.get("content", {}))
+        course_copy.update((key, value) for key, value in update_dict.items() if key != "content")
         course_copy.update({"id": "{}_{}".format(course_copy["id"], cls.demo_course_count)})
         if remove_fields:
             for remove_field in remove_fields:
@@ -41,6 +55,11 @@ class DemoCourse:
                     del course_copy[remove_field]
         return course_copy
 
+    @classmethod
+    def get_many(cls, update_dicts):
+        """ get a new demo course for each of the given update dictionaries """
+        return [cls.get(update_dict) for update_dict in update_dicts]
+
     @classmethod
     def reset_count(cls):
         """ go back to zero """
@@ -3,12 +3,11 @@
 import copy
 from collections import defaultdict
 from datetime import datetime
-import json
 import os
+import pickle
 import pytz
 
 from django.conf import settings
-from django.core.serializers.json import DjangoJSONEncoder
 
 from search.elastic import RESERVED_CHARACTERS
 from search.search_engine_base import SearchEngine
@@ -16,7 +15,10 @@ from search.utils import ValueRange, DateRange, _is_iterable
 
 
 def json_date_to_datetime(json_date_string_value):
-    ''' converts json date string to date object '''
+    ''' converts json date string to date object, passing datetime values read back from the index through '''
+    if isinstance(json_date_string_value, datetime):
+        return json_date_string_value
+
     if "T" in json_date_string_value:
         if "." in json_date_string_value:
             format_string = "%Y-%m-%dT%H:%M:%S.%f"
@@ -116,21 +118,25 @@ def _process_query_string(documents_to_search, query_string):
         string = string.translate(string.maketrans('', '', RESERVED_CHARACTERS))
         return string
 
-    def has_string(dictionary_object, search_string):
-        """ search for string in dictionary items, look down into nested dictionaries """
+    def searchable_values(dictionary_object):
+        """
+        encoded values to search within, looking down into the first nested dictionary;
+        computed once per document rather than once per search string
+        """
+        values = []
         for name in dictionary_object:
             if isinstance(dictionary_object[name], dict):
-                return has_string(dictionary_object[name], search_string)
+                return values + searchable_values(dictionary_object[name])
             if dictionary_object[name]:
-                if search_string.lower() in _encode_string(dictionary_object[name].lower()):
-                    return True
-        return False
+                values.append(_encode_string(dictionary_object[name].lower()))
+        return values
 
-    search_strings = _encode_string(query_string).split(" ")
+    searchable_documents = [(d, searchable_values(d["content"])) for d in documents_to_search if "content" in d]
+    search_strings = _encode_string(query_string).lower().split(" ")
     documents_to_keep = []
     for search_string in search_strings:
         documents_to_keep.extend(
-            [d for d in documents_to_search if "content" in d and has_string(d["content"], search_string)]
+            [d for d, values in searchable_documents if any(search_string in value for value in values)]
         )
 
     return documents_to_keep
@@ -211,22 +217,37 @@ class MockSearchEngine(SearchEngine):
     """
     _mock_elastic = {}
     _disabled = False
+    _dirty = False
+    _backing_fd = None
+    _backing_fd_name = None
     _file_name_override = None
 
     @classmethod
-    def create_test_file(cls, file_name=None, index_content=None):
-        """ creates test file from settings """
+    def create_test_file(cls, file_name=None, index_content=None, raw_bytes=None):
+        """
+        creates test file from settings; raw_bytes, when given, are the already-serialized
+        contents of a backing file and are written out as-is
+        """
+        cls._close_backing_fd()
+        if file_name:
+            cls._file_name_override = file_name
+        if raw_bytes is not None:
+            with open(cls._backing_file(create_if_missing=True), "wb") as dict_file:
+                dict_file.write(raw_bytes)
+            cls._dirty = False
+            cls._load_from_file()
+            return
+
         if index_content:
             cls._mock_elastic = index_content
         else:
             cls._mock_elastic = {}
-        if file_name:
-            cls._file_name_override = file_name
         cls._write_to_file(create_if_missing=True)
 
     @classmethod
     def destroy_test_file(cls):
         """ creates test file from settings """
+        cls._close_backing_fd()
         file_name = cls._backing_file()
         if os.path.exists(file_name):
             os.remove(file_name)
@@ -234,6 +255,13 @@ class MockSearchEngine(SearchEngine):
         cls._file_name_override = None
         cls.destroy()
         cls.__disabled = False  # pylint: disable=unused-private-member
+        cls._dirty = False
+
+    @classmethod
+    def reset(cls):
+        """ empties the index, rewriting the backing file even if it has been removed """
+        cls._mock_elastic = {}
+        cls._write_to_file(create_if_missing=True)
 
     @classmethod
     def _backing_file(cls, create_if_missing=False):
@@ -255,19 +283,54 @@ class MockSearchEngine(SearchEngine):
 
     @classmethod
     def _write_to_file(cls, create_if_missing=False):
+        """
+        write the index dict to the backing file; with MOCK_SEARCH_AUTOFLUSH disabled the write
+        is deferred until the next _flush, which search performs before reading the index
+        """
+        if create_if_missing or getattr(settings, "MOCK_SEARCH_AUTOFLUSH", True):
+            cls._flush(create_if_missing)
+        else:
+            cls._dirty = True
+
+    @classmethod
+    def _flush(cls, create_if_missing=False):
         """ write the index dict to the backing file """
         file_name = cls._backing_file(create_if_missing)
         if file_name:
-            with open(file_name, "w+", encoding='utf-8') as dict_file:
-                json.dump(cls._mock_elastic, dict_file, cls=DjangoJSONEncoder)
+            data = pickle.dumps(cls._mock_elastic, protocol=pickle.HIGHEST_PROTOCOL)
+            backing_fd = cls._open_backing_fd(file_name)
+            os.ftruncate(backing_fd, 0)
+            os.pwrite(backing_fd, data, 0)
+        cls._dirty = False
+
+    @classmethod
+    def _open_backing_fd(cls, file_name):
+        """
+        return a descriptor for the backing file, kept open between writes; destroy and
+        create_test_file, which replace the file, close it
+        """
+        if cls._backing_fd is not None and cls._backing_fd_name != file_name:
+            cls._close_backing_fd()
+        if cls._backing_fd is None:
+            cls._backing_fd = os.open(file_name, os.O_RDWR | os.O_CREAT, 0o644)
+            cls._backing_fd_name = file_name
+        return cls._backing_fd
+
+    @classmethod
+    def _close_backing_fd(cls):
+        """ close the descriptor kept open for the backing file, if any """
+        if cls._backing_fd is not None:
+            os.close(cls._backing_fd)
+            cls._backing_fd = None
+            cls._backing_fd_name = None
 
     @classmethod
     def _load_from_file(cls):
-        """ load the index dict from the contents of the backing file """
+        """ load the index dict from the contents of the backing file, unless it has unflushed changes """
         file_name = cls._backing_file()
-        if file_name and os.path.exists(file_name):
-            with open(file_name, encoding='utf-8') as dict_file:
-                cls._mock_elastic = json.load(dict_file)
+        if file_name and not cls._dirty and os.path.exists(file_name):
+            with open(file_name, "rb") as dict_file:
+                cls._mock_elastic = pickle.load(dict_file)
 
     @staticmethod
     def _paginate_results(size, from_, raw_results):
@@ -311,6 +374,7 @@ class MockSearchEngine(SearchEngine):
     @classmethod
     def destroy(cls):
         """ Clean out the dictionary for test resets """
+        cls._close_backing_fd()
         cls._mock_elastic = {}
         cls._write_to_file()
 
@@ -346,6 +410,9 @@ class MockSearchEngine(SearchEngine):
         """
         Perform search upon documents within index.
         """
+        if MockSearchEngine._dirty:
+            MockSearchEngine._flush()
+
         if MockSearchEngine._disabled:
             return {
                 "took": 10,
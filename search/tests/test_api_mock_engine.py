@@ -2,7 +2,7 @@
 from django.test.utils import override_settings
 
 from search.tests.tests import TEST_INDEX_NAME
-from search.tests.utils import post_discovery_request, setup_democourse
+from search.tests.utils import get_democourses, post_discovery_request, setup_democourse
 from search.tests.factories import DemoCourse
 from .test_views import MockSearchUrlTest
 
@@ -20,9 +20,15 @@ class DiscoveryUrlTest(MockSearchUrlTest):
     Make sure that requests to the url get routed to the correct view handler
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The inherited tests need an empty index, so the courses are indexed anew for every test
+        cls.demo_courses = get_democourses()
+
     def setUp(self):
         super().setUp()
-        setup_democourse(self.searcher)
+        setup_democourse(self.searcher, self.demo_courses)
 
     def test_search_from_url(self):
         """ test searching using the url """
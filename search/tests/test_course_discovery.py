@@ -17,7 +17,7 @@ from meilisearch.errors import MeilisearchApiError
 from search.api import course_discovery_search, NoSearchEngineError
 from search.elastic import ElasticSearchEngine
 from search.tests.factories import DemoCourse
-from search.tests.utils import SearcherMixin, TEST_INDEX_NAME
+from search.tests.utils import SearcherMixin, TEST_INDEX_NAME, TEST_INDEX_SETTINGS
 from search.meilisearch import get_meilisearch_client, create_indexes
 from .mock_search_engine import MockSearchEngine
 
@@ -57,13 +57,12 @@ class TestMockCourseDiscoverySearch(TestCase, SearcherMixin):
             # remove cached property mappings (along with everything else)
             cache.clear()
 
-            config_body = {}
+            config_body = TEST_INDEX_SETTINGS
             # ignore unexpected-keyword-arg; ES python client documents that it can be used
             _elasticsearch.indices.create(index=TEST_INDEX_NAME, ignore=400, body=config_body)
         else:
             MockSearchEngine.destroy()
         DemoCourse.reset_count()
-        self._searcher = None
 
     def tearDown(self):
         # ignore unexpected-keyword-arg; ES python client documents that it can be used
@@ -73,8 +72,6 @@ class TestMockCourseDiscoverySearch(TestCase, SearcherMixin):
             _elasticsearch.indices.delete(index=TEST_INDEX_NAME, ignore=[400, 404])
         else:
             MockSearchEngine.destroy()
-
-        self._searcher = None
         super().tearDown()
 
     def test_course_list(self):
@@ -5,6 +5,7 @@
 
 from unittest.mock import patch, MagicMock
 
+import ddt
 from django.test import TestCase
 from django.test.utils import override_settings
 from elasticsearch import exceptions
@@ -87,43 +88,45 @@ class ElasticSearchTests(MockSearchTests):
         self.assertEqual(aggregation_results["org"]["other"], 1)
 
 
+@ddt.ddt
 @override_settings(SEARCH_ENGINE="search.tests.utils.ForceRefreshElasticSearchEngine")
 @override_settings(ELASTIC_SEARCH_IMPL=ErroringElasticImpl)
 class ErroringElasticTests(TestCase, SearcherMixin):
     """ testing handling of elastic exceptions when they happen """
 
-    def test_index_failure_bulk(self):
+    @ddt.data(
+        ({"return_value": [0, [exceptions.ElasticsearchException()]]}, exceptions.ElasticsearchException),
+        ({"side_effect": Exception()}, Exception),
+    )
+    @ddt.unpack
+    @patch('search.elastic.bulk')
+    def test_index_failure(self, bulk_behaviour, expected_exception, mock_bulk):
         """ the index operation should fail """
-        with patch('search.elastic.bulk', return_value=[0, [exceptions.ElasticsearchException()]]):
-            with self.assertRaises(exceptions.ElasticsearchException):
-                self.searcher.index([{"name": "abc test"}])
-
-    def test_index_failure_general(self):
-        """ the index operation should fail """
-        with patch('search.elastic.bulk', side_effect=Exception()):
-            with self.assertRaises(Exception):
-                self.searcher.index([{"name": "abc test"}])
+        mock_bulk.configure_mock(**bulk_behaviour)
+        with self.assertRaises(expected_exception):
+            self.searcher.index([{"name": "abc test"}])
 
     def test_search_failure(self):
         """ the search operation should fail """
         with self.assertRaises(exceptions.ElasticsearchException):
             self.searcher.search("abc test")
 
-    def test_remove_failure_bulk(self):
+    @ddt.data(
+        (
+            BulkIndexError('Simulated error', [{'delete': {
+                'status': 500, '_index': 'test_index', '_version': 1, 'found': True, '_id': 'test_id'
+            }}]),
+            BulkIndexError,
+        ),
+        (Exception(), Exception),
+    )
+    @ddt.unpack
+    @patch('search.elastic.bulk')
+    def test_remove_failure(self, bulk_error, expected_exception, mock_bulk):
         """ the remove operation should fail """
-        doc_id = 'test_id'
-        error = {'delete': {
-            'status': 500, '_index': 'test_index', '_version': 1, 'found': True, '_id': doc_id
-        }}
-        with patch('search.elastic.bulk', side_effect=BulkIndexError('Simulated error', [error])):
-            with self.assertRaises(BulkIndexError):
-                self.searcher.remove(["test_id"])
-
-    def test_remove_failure_general(self):
-        """ the remove operation should fail """
-        with patch('search.elastic.bulk', side_effect=Exception()):
-            with self.assertRaises(Exception):
-                self.searcher.remove(["test_id"])
+        mock_bulk.side_effect = bulk_error
+        with self.assertRaises(expected_exception):
+            self.searcher.remove(["test_id"])
 
 
 @override_settings(SEARCH_ENGINE="search.elastic.ElasticSearchEngine")
@@ -138,60 +141,75 @@ class ElasticConfigTest(TestCase, SearcherMixin):
         self.assertEqual(hosts, [{'host': '127.0.0.1'}, {'host': 'localhost'}])
 
 
+def _build_mock_es(total, hits, aggregations, use_global_aggs=False):
+    """
+    Build a mocked Elasticsearch client whose search() returns the given hits and aggregations.
+
+    Multi-value searches nest their aggregations under "global_aggs", set use_global_aggs to mimic that.
+    """
+    mock_es = MagicMock()
+    mock_es.search.return_value = {
+        "hits": {
+            "total": {"value": total},
+            "max_score": max((hit["_score"] for hit in hits), default=0.0),
+            "hits": hits,
+        },
+        "aggregations": {"global_aggs": aggregations} if use_global_aggs else aggregations,
+        "took": 2,
+    }
+    return mock_es
+
+
 class ElasticSearchUnitTests(TestCase):
     """
     ElasticSearch tests.
     """
 
-    @patch("search.elastic.Elasticsearch")
-    def test_multivalue_aggregations_translated_correctly(self, mock_elasticsearch_class):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The engine is built once against a mocked client; each test then swaps in its own with _use_mock_es.
+        with patch("search.elastic.Elasticsearch"):
+            cls.engine = ElasticSearchEngine(index=TEST_INDEX_NAME)
+
+    def _use_mock_es(self, *args, **kwargs):
+        """ Swap a client built by _build_mock_es with the given arguments into the engine, for this test only """
+        patcher = patch.object(self.engine, "_es", _build_mock_es(*args, **kwargs))
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_multivalue_aggregations_translated_correctly(self):
         """Tests that multivalue facet aggregations return full facet buckets despite filtering."""
-        mock_es = MagicMock()
-        mock_elasticsearch_class.return_value = mock_es
-
-        mock_es.search.return_value = {
-            "hits": {
-                "total": {"value": 2},
-                "max_score": 1.0,
-                "hits": [
-                    {
-                        "_source": {"org": "OrgA", "language": "en"},
-                        "_score": 1.0
-                    },
-                    {
-                        "_source": {"org": "OrgC", "language": "en"},
-                        "_score": 0.8
+        mock_es = self._use_mock_es(
+            2,
+            [
+                {"_source": {"org": "OrgA", "language": "en"}, "_score": 1.0},
+                {"_source": {"org": "OrgC", "language": "en"}, "_score": 0.8},
+            ],
+            {
+                "language": {
+                    "doc_count": 3,
+                    "values": {
+                        "buckets": [
+                            {"key": "en", "doc_count": 2},
+                            {"key": "fr", "doc_count": 1}
+                        ]
                     }
-                ]
-            },
-            "aggregations": {
-                "global_aggs": {
-                    "language": {
-                        "doc_count": 3,
-                        "values": {
-                            "buckets": [
-                                {"key": "en", "doc_count": 2},
-                                {"key": "fr", "doc_count": 1}
-                            ]
-                        }
-                    },
-                    "org": {
-                        "doc_count": 2,
-                        "values": {
-                            "buckets": [
-                                {"key": "OrgA", "doc_count": 1},
-                                {"key": "OrgC", "doc_count": 1}
-                            ]
-                        }
+                },
+                "org": {
+                    "doc_count": 2,
+                    "values": {
+                        "buckets": [
+                            {"key": "OrgA", "doc_count": 1},
+                            {"key": "OrgC", "doc_count": 1}
+                        ]
                     }
                 }
             },
-            "took": 2,
-        }
-
-        engine = ElasticSearchEngine(index=TEST_INDEX_NAME)
+            use_global_aggs=True,
+        )
 
-        result = engine.search(
+        result = self.engine.search(
             field_dictionary={"language": ["en"]},
             aggregation_terms={
                 "language": {},
@@ -207,37 +225,26 @@ class ElasticSearchUnitTests(TestCase):
 
         mock_es.search.assert_called_once()
 
-    @patch("search.elastic.Elasticsearch")
-    def test_multivalue_with_empty_filters_uses_match_all(self, mock_elasticsearch_class):
+    def test_multivalue_with_empty_filters_uses_match_all(self):
         """Tests that multivalue aggregation works when no filters are applied."""
-        mock_es = MagicMock()
-        mock_elasticsearch_class.return_value = mock_es
-
-        mock_es.search.return_value = {
-            "hits": {
-                "total": {"value": 3},
-                "max_score": 0.0,
-                "hits": []
-            },
-            "aggregations": {
-                "global_aggs": {
-                    "language": {
-                        "doc_count": 3,
-                        "values": {
-                            "buckets": [
-                                {"key": "en", "doc_count": 2},
-                                {"key": "fr", "doc_count": 1}
-                            ]
-                        }
+        self._use_mock_es(
+            3,
+            [],
+            {
+                "language": {
+                    "doc_count": 3,
+                    "values": {
+                        "buckets": [
+                            {"key": "en", "doc_count": 2},
+                            {"key": "fr", "doc_count": 1}
+                        ]
                     }
                 }
             },
-            "took": 2,
-        }
-
-        engine = ElasticSearchEngine(index=TEST_INDEX_NAME)
+            use_global_aggs=True,
+        )
 
-        result = engine.search(
+        result = self.engine.search(
             aggregation_terms={"language": {}},
             field_dictionary={},
             is_multivalue=True
@@ -247,21 +254,12 @@ class ElasticSearchUnitTests(TestCase):
         self.assertEqual(result["aggs"]["language"]["terms"]["en"], 2)
         self.assertEqual(result["aggs"]["language"]["terms"]["fr"], 1)
 
-    @patch("search.elastic.Elasticsearch")
-    def test_regular_aggregations_do_not_use_global_aggs(self, mock_elasticsearch_class):
+    def test_regular_aggregations_do_not_use_global_aggs(self):
         """Tests that single-value aggregation does not include global_aggs wrapper."""
-        mock_es = MagicMock()
-        mock_elasticsearch_class.return_value = mock_es
-        mock_es.search.return_value = {
-            "hits": {
-                "total": {"value": 1},
-                "max_score": 1.0,
-                "hits": [{
-                    "_source": {"org": "OrgX", "language": "en"},
-                    "_score": 1.0
-                }]
-            },
-            "aggregations": {
+        mock_es = self._use_mock_es(
+            1,
+            [{"_source": {"org": "OrgX", "language": "en"}, "_score": 1.0}],
+            {
                 "language": {
                     "buckets": [
                         {"key": "en", "doc_count": 1}
@@ -273,12 +271,9 @@ class ElasticSearchUnitTests(TestCase):
                 "total_modes_docs": {"value": 1.0},
                 "total_org_docs": {"value": 1.0}
             },
-            "took": 2,
-        }
-
-        engine = ElasticSearchEngine(index=TEST_INDEX_NAME)
+        )
 
-        result = engine.search(
+        result = self.engine.search(
             field_dictionary={"language": ["en"]},
             aggregation_terms={"language": {}},
             is_multivalue=False
@@ -293,38 +288,25 @@ class ElasticSearchUnitTests(TestCase):
         self.assertIn("language", search_body["aggs"])
         self.assertNotIn("global_aggs", search_body["aggs"])
 
-    @patch("search.elastic.Elasticsearch")
-    def test_multivalue_aggregations_use_global_aggs(self, mock_elasticsearch_class):
+    def test_multivalue_aggregations_use_global_aggs(self):
         """Tests that multi-value aggregation includes global_aggs wrapper."""
-        mock_es = MagicMock()
-        mock_elasticsearch_class.return_value = mock_es
-        mock_es.search.return_value = {
-            "hits": {
-                "total": {"value": 1},
-                "max_score": 1.0,
-                "hits": [{
-                    "_source": {"org": "OrgX", "language": "en"},
-                    "_score": 1.0
-                }]
-            },
-            "aggregations": {
-                "global_aggs": {
-                    "language": {
-                        "doc_count": 1,
-                        "values": {
-                            "buckets": [
-                                {"key": "en", "doc_count": 1}
-                            ]
-                        }
+        mock_es = self._use_mock_es(
+            1,
+            [{"_source": {"org": "OrgX", "language": "en"}, "_score": 1.0}],
+            {
+                "language": {
+                    "doc_count": 1,
+                    "values": {
+                        "buckets": [
+                            {"key": "en", "doc_count": 1}
+                        ]
                     }
                 }
             },
-            "took": 2,
-        }
-
-        engine = ElasticSearchEngine(index=TEST_INDEX_NAME)
+            use_global_aggs=True,
+        )
 
-        result = engine.search(
+        result = self.engine.search(
             field_dictionary={"language": ["en"]},
             aggregation_terms={"language": {}},
             is_multivalue=True
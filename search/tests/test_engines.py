@@ -3,114 +3,105 @@
 # error, but they do get used when included as part of the override_settings
 """ Tests for search functionality """
 
-import json
 import os
 from datetime import datetime
 
+from django.conf import settings
 from django.test import TestCase
 from django.test.utils import override_settings
 from search.api import NoSearchEngineError, perform_search
-from search.tests.mock_search_engine import MockSearchEngine, json_date_to_datetime
+from search.tests.mock_search_engine import MockSearchEngine
 from search.tests.tests import MockSearchTests
 
+# give each pytest-xdist worker its own backing files so that the file-backed tests can run in parallel
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
 
-@override_settings(MOCK_SEARCH_BACKING_FILE="./testfile.pkl")
+
+# as a class decorator on a TestCase, override_settings is enabled once in setUpClass rather than per test
+@override_settings(MOCK_SEARCH_BACKING_FILE=f"./testfile_{_WORKER}.pkl", MOCK_SEARCH_AUTOFLUSH=False)
 class FileBackedMockSearchTests(MockSearchTests):
     """ Override that runs the same tests with file-backed MockSearchEngine """
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         MockSearchEngine.create_test_file()
-        self._searcher = None
-
-    def tearDown(self):
+        # the backing file is pickled, so the datetime must come back with its microseconds
+        cls._moment = datetime(2015, 2, 1, 7, 30, 28, 65785)
+        cls._doc_template = {
+            "content": {
+                "name": "How did 11 of 12 balls get deflated during the game"
+            },
+            "my_date_value": cls._moment,
+            "my_integer_value": 172,
+            "my_float_value": 57.654,
+            "my_string_value": "If the officials just blew it, would they come out and admit it?"
+        }
+
+    @classmethod
+    def tearDownClass(cls):
         MockSearchEngine.destroy_test_file()
-        self._searcher = None
-        super().tearDown()
+        super().tearDownClass()
+
+    def setUp(self):
+        MockSearchEngine.reset()
+        super().setUp()
 
     def test_file_value_formats(self):
         """ test the format of values that write/read from the file """
-        # json serialization removes microseconds part of the datetime object, so
-        # we strip it at the beginning to allow equality comparison to be correct
-        this_moment = datetime.utcnow().replace(microsecond=0)
-        self.searcher.index([
-            {
-                "content": {
-                    "name": "How did 11 of 12 balls get deflated during the game"
-                },
-                "my_date_value": this_moment,
-                "my_integer_value": 172,
-                "my_float_value": 57.654,
-                "my_string_value": "If the officials just blew it, would they come out and admit it?"
-            },
-        ])
+        self.searcher.index([dict(self._doc_template)])
 
         # now search should be successful
         response = self.searcher.search(query_string="deflated")
         self.assertEqual(response["total"], 1)
 
         # and values should be what we desire
-        returned_result = response["results"][0]["data"]
-        self.assertEqual(
-            json_date_to_datetime(returned_result["my_date_value"]),
-            this_moment
-        )
-        self.assertEqual(returned_result["my_integer_value"], 172)
-        self.assertEqual(returned_result["my_float_value"], 57.654)
-        self.assertEqual(
-            returned_result["my_string_value"],
-            "If the officials just blew it, would they come out and admit it?"
-        )
+        self.assertEqual(response["results"][0]["data"], self._doc_template)
 
     def test_disabled_index(self):
         """
         Make sure that searchengine operations are shut down when mock engine has a filename, but file does
         not exist - this is helpful for test scenarios where we essentially want to not slow anything down
         """
-        this_moment = datetime.utcnow().replace(microsecond=0)
-        self.searcher.index([
-            {
-                "id": "FAKE_ID",
-                "content": {
-                    "name": "How did 11 of 12 balls get deflated during the game"
-                },
-                "my_date_value": this_moment,
-                "my_integer_value": 172,
-                "my_float_value": 57.654,
-                "my_string_value": "If the officials just blew it, would they come out and admit it?"
-            },
-        ])
+        self.searcher.index([dict(self._doc_template, id="FAKE_ID")])
         response = self.searcher.search(query_string="deflated")
         self.assertEqual(response["total"], 1)
 
         # copy content, and then erase file so that backed file is not present and work is disabled
+        MockSearchEngine._flush()  # pylint: disable=protected-access
         initial_file_content = None
-        with open("testfile.pkl", encoding='utf-8') as dict_file:
-            initial_file_content = json.load(dict_file)
-        os.remove("testfile.pkl")
+        with open(settings.MOCK_SEARCH_BACKING_FILE, "rb") as dict_file:
+            initial_file_content = dict_file.read()
+        os.remove(settings.MOCK_SEARCH_BACKING_FILE)
 
-        response = self.searcher.search(query_string="ABC")
-        self.assertEqual(response["total"], 0)
+        try:
+            response = self.searcher.search(query_string="ABC")
+            self.assertEqual(response["total"], 0)
 
-        self.searcher.index([{"content": {"name": "ABC"}}])
-        # now search should be unsuccessful because file does not exist
-        response = self.searcher.search(query_string="ABC")
-        self.assertEqual(response["total"], 0)
+            self.searcher.index([{"content": {"name": "ABC"}}])
+            # now search should be unsuccessful because file does not exist
+            response = self.searcher.search(query_string="ABC")
+            self.assertEqual(response["total"], 0)
 
-        # remove it, and then we'll reload file and it still should be there
-        self.searcher.remove(["FAKE_ID"])
+            # remove it, and then we'll reload file and it still should be there
+            self.searcher.remove(["FAKE_ID"])
 
-        MockSearchEngine.create_test_file("fakefile.pkl", initial_file_content)
+            MockSearchEngine.create_test_file(f"fakefile_{_WORKER}.pkl", raw_bytes=initial_file_content)
 
-        # now search should be successful because file did exist in file
-        response = self.searcher.search(query_string="deflated")
-        self.assertEqual(response["total"], 1)
+            # now search should be successful because file did exist in file
+            response = self.searcher.search(query_string="deflated")
+            self.assertEqual(response["total"], 1)
 
-        self.searcher.remove(["FAKE_ID"])
-        response = self.searcher.search(query_string="deflated")
-        self.assertEqual(response["total"], 0)
+            self.searcher.remove(["FAKE_ID"])
+            response = self.searcher.search(query_string="deflated")
+            self.assertEqual(response["total"], 0)
+        finally:
+            # the class shares one backing file, so put it back for the remaining tests
+            MockSearchEngine.destroy_test_file()
+            MockSearchEngine.create_test_file()
 
 
+# get_search_engine checks a waffle switch before looking at SEARCH_ENGINE, so this stays a TestCase
 @override_settings(SEARCH_ENGINE=None)
 class TestNone(TestCase):
     """ Tests correct skipping of operation when no search engine is defined """
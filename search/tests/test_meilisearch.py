@@ -3,6 +3,7 @@ Test for the Meilisearch search engine.
 """
 
 from datetime import datetime
+import json
 from unittest.mock import Mock, patch, MagicMock, PropertyMock
 
 import django.test
@@ -47,6 +48,25 @@ class DocumentEncoderTests(django.test.TestCase):
         encoded = encoder.encode(document)
         assert '{"description": "I \\u2665 strings!"}' == encoded
 
+    def test_encode_documents(self):
+        documents = [
+            {
+                "date": timezone.datetime(
+                    2024, 12, 31, 5, 0, 0, tzinfo=timezone.get_fixed_timezone(0)
+                ),
+                "description": "I ♥ strings!",
+                "nested": {1: [1.5, None, True]},
+            }
+        ]
+        expected = [
+            {
+                "date": "2024-12-31 05:00:00+00:00",
+                "description": "I ♥ strings!",
+                "nested": {"1": [1.5, None, True]},
+            }
+        ]
+        assert expected == json.loads(search.meilisearch.encode_documents(documents))
+
 
 class EngineTests(django.test.TestCase):
     """
@@ -196,9 +216,11 @@ class EngineTests(django.test.TestCase):
         aggs = processed_results["aggs"]
         assert {
             "terms": {"audit": 1, "honor": 3},
-            "total": 4.0,
+            "total": 4,
             "other": 0,
         } == aggs["modes"]
+        # facet counts are integers, and the total is kept as such
+        assert isinstance(aggs["modes"]["total"], int)
 
     def test_search_params(self):
         params = search.meilisearch.get_search_params(aggregation_terms=self.aggregation_terms)
@@ -328,7 +350,7 @@ class EngineTests(django.test.TestCase):
         mock_index = Mock()
         mock_meilisearch_index.return_value = mock_index
         engine = search.meilisearch.MeilisearchEngine(index="my_index")
-        engine.meilisearch_index.add_documents = Mock()
+        engine.meilisearch_index.add_documents_json = Mock()
         document = {
             "id": "abcd",
             "name": "My name",
@@ -343,10 +365,31 @@ class EngineTests(django.test.TestCase):
             "title": "My title",
         }
         engine.index(sources=[document])
-        engine.meilisearch_index.add_documents.assert_called_with(
-            [processed_document],
-            serializer=search.meilisearch.DocumentEncoder,
-        )
+        engine.meilisearch_index.add_documents_json.assert_called_once()
+        (payload,), _kwargs = engine.meilisearch_index.add_documents_json.call_args
+        assert [processed_document] == json.loads(payload)
+
+    @patch.object(search.meilisearch, "MEILISEARCH_BATCH_SIZE", 2)
+    @patch('search.meilisearch.MeilisearchEngine.meilisearch_index', new_callable=PropertyMock)
+    def test_engine_index_in_batches(self, mock_meilisearch_index):
+        mock_index = Mock()
+        mock_meilisearch_index.return_value = mock_index
+        engine = search.meilisearch.MeilisearchEngine(index="my_index")
+        engine.index(sources=[{"id": "id1"}, {"id": "id2"}, {"id": "id3"}])
+        batches = [json.loads(payload) for (payload,), _kwargs in mock_index.add_documents_json.call_args_list]
+        assert [["id1", "id2"], ["id3"]] == [[doc["id"] for doc in batch] for batch in batches]
+
+    @patch('search.meilisearch.MeilisearchEngine.meilisearch_index', new_callable=PropertyMock)
+    def test_engine_index_serialize_for_transport(self, mock_meilisearch_index):
+        mock_index = Mock()
+        mock_meilisearch_index.return_value = mock_index
+
+        class CustomEngine(search.meilisearch.MeilisearchEngine):
+            def _serialize_for_transport(self, documents):
+                return b"custom"
+
+        CustomEngine(index="my_index").index(sources=[{"id": "abcd"}])
+        mock_index.add_documents_json.assert_called_once_with(b"custom")
 
     @patch('search.meilisearch.MeilisearchEngine.meilisearch_index', new_callable=PropertyMock)
     def test_engine_search(self, mock_meilisearch_index):
@@ -436,59 +479,46 @@ class EngineTests(django.test.TestCase):
         self.assertListEqual(rules, ['language = "en" OR language = "fr"'])
 
     def test_multivalue_search_expands_selected_facet_without_filtering(self):
-        multivalue_distribution = {'en': 1, 'fr': 2}
-
-        engine = search.meilisearch.MeilisearchEngine(index="test_index")
-        engine.meilisearch_index.search = Mock(
-            return_value={
-                'hits': [],
-                'query': '',
-                'processingTimeMs': 0,
-                'limit': 0,
-                'offset': 0,
-                'estimatedTotalHits': 4,
-                'facetDistribution':
-                    {'language': multivalue_distribution},
-                'facetStats': {}
-            }
-        )
-
         original_filter = [
             'language = "en" OR language = "fr"',
             'modes = "audit" OR modes = "honor"',
             'org = "EDX"',
         ]
         selected_facet = 'language'
-        actual_distribution = engine._get_expanded_distribution(  # pylint: disable=protected-access
-            '', selected_facet, original_filter
+        engine_class = search.meilisearch.MeilisearchEngine
+        opt_params = engine_class._get_expanded_distribution_params(  # pylint: disable=protected-access
+            selected_facet, original_filter
         )
-        self.assertDictEqual(actual_distribution, multivalue_distribution)
-        (query, opt_params), _ = engine.meilisearch_index.search.call_args  # pylint: disable=unused-variable
-        self.assertIn(selected_facet, opt_params['facets'])
-        self.assertFalse(any(rule.startswith(f'{selected_facet} = ') for rule in opt_params['filter']))
+        self.assertListEqual(opt_params['facets'], [selected_facet])
+        self.assertListEqual(opt_params['filter'], ['modes = "audit" OR modes = "honor"', 'org = "EDX"'])
+        # only the distribution is needed, not the results
+        self.assertEqual(opt_params['limit'], 0)
 
-    def test_multivalue_search_merges_expanded_facet_distributions(self):
+    @patch('search.meilisearch.get_meilisearch_client')
+    def test_multivalue_search_merges_expanded_facet_distributions(self, mock_get_client):
         engine = search.meilisearch.MeilisearchEngine(index='test_index')
-        engine.meilisearch_index.search = Mock(side_effect=[
-            {
-                "hits": [],
-                "query": "",
-                "processingTimeMs": 5,
-                "limit": 20,
-                "offset": 0,
-                "estimatedTotalHits": 0,
-                "facetDistribution": {
-                    "language": {"en": 2},  # Narrowed distribution after selecting a facet value
-                    "org": {"EDX": 2}
-                },
+        engine.meilisearch_index.search = Mock(return_value={
+            "hits": [],
+            "query": "",
+            "processingTimeMs": 5,
+            "limit": 20,
+            "offset": 0,
+            "estimatedTotalHits": 0,
+            "facetDistribution": {
+                "language": {"en": 2},  # Narrowed distribution after selecting a facet value
+                "org": {"EDX": 2}
             },
-            {
-                "hits": [],
-                "facetDistribution": {
-                    "language": {"en": 2, "fr": 1}  # Expanded distribution for multivalue search
+        })
+        mock_get_client.return_value.multi_search.return_value = {
+            "results": [
+                {
+                    "hits": [],
+                    "facetDistribution": {
+                        "language": {"en": 2, "fr": 1}  # Expanded distribution for multivalue search
+                    }
                 }
-            }
-        ])
+            ]
+        }
 
         results = engine.search(
             query_string='',
@@ -496,6 +526,9 @@ class EngineTests(django.test.TestCase):
             aggregation_terms=self.aggregation_terms,
             is_multivalue=True,
         )
+        (queries,), _ = mock_get_client.return_value.multi_search.call_args
+        self.assertEqual(1, len(queries))
+        self.assertEqual(['language'], queries[0]['facets'])
         aggregations = results["aggs"]
         self.assertIn("language", aggregations)
         self.assertIn("org", aggregations)
@@ -607,7 +640,7 @@ class UtilitiesTests(django.test.TestCase):
                 self.number_of_calls += 1
                 if self.number_of_calls == 1:
                     error = meilisearch.errors.MeilisearchApiError("", Response())
-                    error.code = "index_not_found"
+                    error.code = search.meilisearch.INDEX_NOT_FOUND_ERROR_CODE
                     raise error
                 if self.number_of_calls == 2:
                     return f"index created: {index_name}"
@@ -626,20 +659,38 @@ class IndexSortablesAndTransformTests(django.test.TestCase):
     Tests for INDEX_SORTABLES configuration, sortable attributes functionality, and _transform_sort_by method.
     """
 
-    @patch('search.meilisearch.get_meilisearch_client')
-    def test_meilisearch_index_calls_update_sortable_attributes(self, mock_get_client):
-        mock_index = Mock()
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.index.return_value = mock_index
+    @patch.object(search.meilisearch, "wait_for_task_to_succeed")
+    @patch.object(search.meilisearch, "get_or_create_meilisearch_index")
+    @patch.object(search.meilisearch, "get_meilisearch_client")
+    def test_create_indexes_updates_sortable_attributes(self, _mock_get_client, mock_get_or_create, _mock_wait):
+        mock_index = mock_get_or_create.return_value
+        mock_index.get_filterable_attributes.return_value = []
+        mock_index.get_sortable_attributes.return_value = ["title"]
 
-        engine = search.meilisearch.MeilisearchEngine(index="test_index")
+        search.meilisearch.create_indexes({"course_info": []})
+
+        # existing sortable attributes are preserved
+        (sortables,), _ = mock_index.update_sortable_attributes.call_args
+        assert ["start", "title"] == sorted(sortables)
+
+    @patch.object(search.meilisearch, "get_or_create_meilisearch_index")
+    @patch.object(search.meilisearch, "get_meilisearch_client")
+    def test_create_indexes_skips_present_sortable_attributes(self, _mock_get_client, mock_get_or_create):
+        mock_index = mock_get_or_create.return_value
+        mock_index.get_sortable_attributes.return_value = ["start"]
+
+        search.meilisearch.create_indexes({"course_info": []})
+
+        mock_index.update_sortable_attributes.assert_not_called()
+
+    @patch('search.meilisearch.get_meilisearch_client')
+    def test_meilisearch_index_does_not_update_settings(self, mock_get_client):
+        mock_index = mock_get_client.return_value.index.return_value
 
-        # Access the property to trigger the call
-        _ = engine.meilisearch_index
+        engine = search.meilisearch.MeilisearchEngine(index="course_info")
+        assert engine.meilisearch_index is engine.meilisearch_index
 
-        # Verify update_sortable_attributes was called
-        mock_index.update_sortable_attributes.assert_called()
+        mock_index.update_sortable_attributes.assert_not_called()
 
     @patch('search.meilisearch.MeilisearchEngine.meilisearch_index', new_callable=PropertyMock)
     def test_transform_sort_by_single_field_asc(self, mock_meilisearch_index):
@@ -7,13 +7,14 @@ import ddt
 from django.urls import Resolver404, resolve
 from django.test import TestCase
 from django.test.utils import override_settings
+from elasticsearch import Elasticsearch
 from waffle.testutils import override_switch
 
 from search.search_engine_base import SearchEngine
 from search.search_engine_base import DEFAULT_ELASTIC_SEARCH_SWITCH
 from search.elastic import ElasticSearchEngine
 from search.tests.mock_search_engine import MockSearchEngine
-from search.tests.utils import post_request, SearcherMixin, TEST_INDEX_NAME
+from search.tests.utils import post_request, SearcherMixin, TEST_INDEX_NAME, TEST_INDEX_SETTINGS
 
 
 # Any class that inherits from TestCase will cause too-many-public-methods pylint error
@@ -33,14 +34,12 @@ class MockSearchUrlTest(TestCase, SearcherMixin):
     def setUp(self):
         super().setUp()
         MockSearchEngine.destroy()
-        self._searcher = None
         patcher = patch('search.views.track')
         self.mock_tracker = patcher.start()
         self.addCleanup(patcher.stop)
 
     def tearDown(self):
         MockSearchEngine.destroy()
-        self._searcher = None
         super().tearDown()
 
     def assert_no_events_were_emitted(self):
@@ -451,6 +450,23 @@ class ElasticSearchUrlTest(TestCase, SearcherMixin):
     Elastic-specific tests
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Create the index with the test settings before the engine creates it with the defaults:
+        # writes wait for the next refresh, and the test settings keep its interval short.
+        # ignore unexpected-keyword-arg; ES python client documents that it can be used
+        # pylint: disable=unexpected-keyword-arg
+        _elasticsearch = Elasticsearch()
+        _elasticsearch.indices.delete(index=TEST_INDEX_NAME, ignore=[400, 404])
+        _elasticsearch.indices.create(index=TEST_INDEX_NAME, ignore=400, body=TEST_INDEX_SETTINGS)
+
+    @classmethod
+    def tearDownClass(cls):
+        # pylint: disable=unexpected-keyword-arg
+        Elasticsearch().indices.delete(index=TEST_INDEX_NAME, ignore=[400, 404])
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
         patcher = patch('search.views.track')
@@ -12,7 +12,7 @@ from elasticsearch import Elasticsearch
 
 from search.search_engine_base import SearchEngine
 from search.elastic import ElasticSearchEngine
-from search.tests.utils import SearcherMixin, TEST_INDEX_NAME
+from search.tests.utils import SearcherMixin, TEST_INDEX_NAME, TEST_INDEX_SETTINGS
 from search.utils import ValueRange, DateRange
 
 from .mock_search_engine import MockSearchEngine
@@ -21,6 +21,9 @@ from .mock_search_engine import MockSearchEngine
 @override_settings(SEARCH_ENGINE="search.tests.mock_search_engine.MockSearchEngine")
 @override_settings(ELASTIC_FIELD_MAPPINGS={"start_date": {"type": "date"}})
 @override_settings(MOCK_SEARCH_BACKING_FILE=None)
+# TestCase already opens one transaction per class and rolls back to a savepoint
+# after each test; the waffle switch lookup in get_search_engine needs the DB,
+# so SimpleTestCase is not an option here.
 class MockSearchTests(TestCase, SearcherMixin):
     """ Test operation of search activities """
 
@@ -45,12 +48,11 @@ class MockSearchTests(TestCase, SearcherMixin):
             # Make sure that we are fresh
             _elasticsearch.indices.delete(index=self.index_name, ignore=[400, 404])
 
-            config_body = {}
+            config_body = TEST_INDEX_SETTINGS
             # ignore unexpected-keyword-arg; ES python client documents that it can be used
             _elasticsearch.indices.create(index=self.index_name, ignore=400, body=config_body)
         else:
             MockSearchEngine.destroy()
-        self._searcher = None
         cache.clear()
 
     def tearDown(self):
@@ -62,8 +64,6 @@ class MockSearchTests(TestCase, SearcherMixin):
             _elasticsearch.indices.delete(index=self.index_name, ignore=[400, 404])
         else:
             MockSearchEngine.destroy()
-
-        self._searcher = None
         super().tearDown()
 
     def test_factory_creator(self):
@@ -776,7 +776,7 @@ class MockSearchTests(TestCase, SearcherMixin):
         self.assertIn("FAKE_ID_5", result_ids)
 
     def _index_for_aggs(self):
-        """ Prepare index for aggregation tests """
+        """ Prepare index for aggregation tests, in a single index call """
         self.searcher.index([
             {"id": "FAKE_ID_1", "subject": "mathematics", "org": "edX"},
             {"id": "FAKE_ID_2", "subject": "mathematics", "org": "MIT"},
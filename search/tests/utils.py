@@ -1,7 +1,8 @@
 """ Test utilities """
 
+import atexit
+import functools
 import json
-import time
 from django.test import Client
 from elasticsearch import Elasticsearch, exceptions
 from meilisearch.errors import MeilisearchApiError
@@ -9,27 +10,54 @@ from search.search_engine_base import SearchEngine
 from search.tests.mock_search_engine import MockSearchEngine
 from search.tests.factories import DemoCourse
 from search.elastic import ElasticSearchEngine
-from search.meilisearch import create_indexes, get_meilisearch_client
+from search.meilisearch import create_indexes, get_meilisearch_client, get_meilisearch_index_name
 
 
 TEST_INDEX_NAME = "test_index"
 
+# Settings for the Elasticsearch test indices: writes made with refresh="wait_for" return
+# once the next scheduled refresh makes them visible, so keep the refresh interval short.
+# A single node needs no replicas, and a single shard is enough for the test documents.
+TEST_INDEX_SETTINGS = {
+    "settings": {"index": {"refresh_interval": "200ms", "number_of_shards": 1, "number_of_replicas": 0}}
+}
+
+
+@functools.cache
+def _get_es():
+    """
+    Elasticsearch client shared by the test setup helpers, such that they reuse a single
+    connection pool; it is closed when the test process exits.
+    """
+    es = Elasticsearch()
+    atexit.register(es.transport.close)
+    return es
+
+
+@functools.cache
+def _get_client():
+    """
+    Test client shared by the post helpers; its handler loads the middleware once, on the
+    first request, rather than once per post. The search views keep no session state.
+    """
+    return Client()
+
 
 def post_request(body, course_id=None):
     """
     Helper method to post the request and process the response
     """
     address = '/{}'.format(course_id if course_id else '')
-    response = Client().post(address, body)
+    response = _get_client().post(address, body)
 
-    return getattr(response, "status_code", 500), json.loads(getattr(response, "content", None).decode('utf-8'))
+    return response.status_code, json.loads(response.content)
 
 
 def post_discovery_request(body, address='/course_discovery/'):
     """ Helper method to post the request and process the response """
-    response = Client().post(address, body)
+    response = _get_client().post(address, body)
 
-    return getattr(response, "status_code", 500), json.loads(getattr(response, "content", None).decode('utf-8'))
+    return response.status_code, json.loads(response.content)
 
 
 # pylint: disable=too-few-public-methods
@@ -39,26 +67,32 @@ class SearcherMixin:
 
     @property
     def searcher(self):
-        """ cached instance of search engine """
-        if self._searcher is None:
-            self._searcher = SearchEngine.get_search_engine(TEST_INDEX_NAME)
-        return self._searcher
+        """
+        instance of search engine, cached on the test class so that all of its tests share it;
+        subclasses get their own, since their settings may select another engine. The engine
+        follows the class-level settings, so a test that overrides SEARCH_ENGINE on its own
+        must build its own engine.
+        """
+        test_class = type(self)
+        if test_class.__dict__.get("_searcher") is None:
+            test_class._searcher = SearchEngine.get_search_engine(TEST_INDEX_NAME)  # pylint: disable=protected-access
+        return test_class._searcher  # pylint: disable=protected-access
 
 
 # We override ElasticSearchEngine class in order to force an index refresh upon index
 # otherwise we often get results from the prior state, rendering the tests less useful
 class ForceRefreshElasticSearchEngine(ElasticSearchEngine):
     """
-    Override of ElasticSearchEngine that forces the update of the index,
+    Override of ElasticSearchEngine that waits for the update of the index,
     so that tests can relaibly search right afterward
     """
 
     def index(self, sources, **kwargs):
-        kwargs["refresh"] = True
+        kwargs.setdefault("refresh", "wait_for")
         super().index(sources, **kwargs)
 
     def remove(self, doc_ids, **kwargs):
-        kwargs["refresh"] = True
+        kwargs.setdefault("refresh", "wait_for")
         super().remove(doc_ids, **kwargs)
 
 
@@ -91,8 +125,10 @@ class ErroringElasticImpl(Elasticsearch):
 def setup_meilisearch(index_name, logger):  # pragma: no cover
     """Helper method to set up Meilisearch engine"""
     client = get_meilisearch_client()
+    # The engine and create_indexes work on the prefixed index name
+    meilisearch_index_name = get_meilisearch_index_name(index_name)
     try:
-        task_info = client.get_index(index_name).delete()
+        task_info = client.delete_index(meilisearch_index_name)
         client.wait_for_task(task_info.task_uid, timeout_in_ms=5000)
     except MeilisearchApiError:
         pass
@@ -103,52 +139,66 @@ def setup_meilisearch(index_name, logger):  # pragma: no cover
         "language", "modes", "org", "catalog_visibility", "enrollment_start", "enrollment_end",
     ]})
 
-    def wait(seconds=1):
-        """Add small delay to wait for Meilisearch tasks to complete"""
-        time.sleep(seconds)
+    def wait(task_uid=None, timeout_in_ms=5000):
+        """
+        Wait for the given Meilisearch task to complete or, by default, for all the tasks that
+        are still pending on the test index
+        """
+        if task_uid is not None:
+            client.wait_for_task(task_uid, timeout_in_ms=timeout_in_ms)
+            return
+        pending_tasks = client.get_tasks({
+            "statuses": ["enqueued", "processing"],
+            "indexUids": [meilisearch_index_name],
+        }).results
+        for task in pending_tasks:
+            client.wait_for_task(task.uid, timeout_in_ms=timeout_in_ms)
 
     return {"search_engine": "search.meilisearch.MeilisearchEngine", "wait": wait}
 
 
 def setup_elasticsearch(index_name):
     """Helper method to set up Elasticsearch engine"""
-    es = Elasticsearch()
+    es = _get_es()
     es.indices.delete(index=index_name, ignore=[400, 404])  # pylint: disable=unexpected-keyword-arg
-    es.indices.create(index=index_name, ignore=400, body={})  # pylint: disable=unexpected-keyword-arg
+    es.indices.create(index=index_name, ignore=400, body=TEST_INDEX_SETTINGS)  # pylint: disable=unexpected-keyword-arg
 
     return {"search_engine": "search.tests.utils.ForceRefreshElasticSearchEngine", "wait": lambda: None}
 
 
-def setup_democourse(searcher):
-    """Set up a demo course to use in api tests"""
+def get_democourses():
+    """Build the demo courses used in api tests"""
     DemoCourse.reset_count()
-    DemoCourse.get_and_index(
-        searcher,
+    return DemoCourse.get_many([
         {
             "org": "OrgA",
             "language": "en",
             "content": {
                 "short_description": "Find this one with the right parameter"
             }
-        }
-    )
-    DemoCourse.get_and_index(
-        searcher,
+        },
         {
             "org": "OrgB",
             "language": "fr",
             "content": {
                 "short_description": "Find this one with another parameter"
             }
-        }
-    )
-    DemoCourse.get_and_index(
-        searcher,
+        },
         {
             "org": "OrgC",
             "language": "en",
             "content": {
                 "short_description": "Find this one somehow"
             }
-        }
-    )
+        },
+    ])
+
+
+def setup_democourse(searcher, courses=None):
+    """
+    Set up a demo course to use in api tests; test classes that index it for every test can build
+    the courses once with get_democourses and pass them in, as long as no test modifies them
+    """
+    if courses is None:
+        courses = get_democourses()
+    DemoCourse.index(searcher, courses)